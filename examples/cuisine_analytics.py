@@ -5,7 +5,7 @@ Cuisine analytics script - analyzes restaurant data by cuisine type
 
 import sys
 import os
-from collections import Counter
+from collections import Counter, defaultdict
 
 # Add parent directory to path so we can import wolt_api
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -39,12 +39,19 @@ def analyze_cuisine_availability():
         print(f"\n🍽️  Cuisine Type Analysis:")
         print("-" * 30)
         
-        # Count all cuisine types
-        all_cuisines = []
+        # Single pass over the restaurants: count cuisines and collect
+        # ratings together instead of re-scanning the list per cuisine
+        cuisine_counter = Counter()
+        online_cuisine_counter = Counter()
+        cuisine_ratings = defaultdict(list)
+
         for restaurant in restaurants:
-            all_cuisines.extend(restaurant.cuisine_types)
-        
-        cuisine_counter = Counter(all_cuisines)
+            cuisine_counter.update(restaurant.cuisine_types)
+            if restaurant.is_online:
+                online_cuisine_counter.update(restaurant.cuisine_types)
+            if restaurant.rating is not None:
+                for cuisine in restaurant.cuisine_types:
+                    cuisine_ratings[cuisine].append(restaurant.rating)
         
         print("Most common cuisine types:")
         for cuisine, count in cuisine_counter.most_common(10):
@@ -56,12 +63,12 @@ def analyze_cuisine_availability():
         print("-" * 35)
         
         cuisine_availability = {}
-        
+
+        # Online counts come from the Counter built in the single pass
+        # above - an O(1) lookup per cuisine instead of rescanning the
+        # online list 15 times
         for cuisine, total_count in cuisine_counter.most_common(15):
-            online_count = sum(
-                1 for r in online_restaurants 
-                if cuisine in r.cuisine_types
-            )
+            online_count = online_cuisine_counter[cuisine]
             availability_rate = (online_count / total_count) * 100
             cuisine_availability[cuisine] = {
                 'total': total_count,
@@ -79,19 +86,11 @@ def analyze_cuisine_availability():
         for cuisine, data in sorted_cuisines:
             print(f"  {cuisine:15} {data['online']:2d}/{data['total']:2d} online ({data['rate']:5.1f}%)")
         
-        # Find best rated cuisines
+        # Find best rated cuisines (ratings were collected in the same pass
+        # as the cuisine counts above)
         print(f"\n⭐ Highest Rated Cuisine Types:")
         print("-" * 32)
-        
-        cuisine_ratings = {}
-        
-        for restaurant in restaurants:
-            if restaurant.rating is not None:
-                for cuisine in restaurant.cuisine_types:
-                    if cuisine not in cuisine_ratings:
-                        cuisine_ratings[cuisine] = []
-                    cuisine_ratings[cuisine].append(restaurant.rating)
-        
+
         # Calculate average ratings (only for cuisines with 3+ restaurants)
         cuisine_avg_ratings = {}
         for cuisine, ratings in cuisine_ratings.items():
@@ -3,9 +3,10 @@
 Restaurant monitoring script - tracks availability of specific restaurants
 """
 
+import asyncio
 import sys
 import os
-import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # Add parent directory to path so we can import wolt_api
@@ -25,63 +26,87 @@ CITIES = {
     "haifa": (32.7940, 34.9896),
 }
 
-def monitor_restaurants():
+# How often to re-check the monitored restaurants
+CHECK_INTERVAL_SECONDS = 300
+
+
+async def monitor_restaurants():
     """Monitor restaurants and report status changes"""
     api = WoltAPI(rate_limit_delay=2.0)  # Slower rate to be respectful
-    
+
     print("🔍 Restaurant Availability Monitor")
     print("=" * 50)
     print(f"Monitoring {len(RESTAURANTS_TO_MONITOR)} restaurants...")
     print(f"Check frequency: Every 5 minutes")
     print("Press Ctrl+C to stop\n")
-    
+
     previous_status = {}
-    
-    try:
-        while True:
-            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            print(f"[{current_time}] Checking restaurant status...")
-            
-            for slug in RESTAURANTS_TO_MONITOR:
-                try:
-                    is_open = api.is_restaurant_open(slug)
-                    
-                    # Check if status changed
-                    if slug in previous_status:
-                        if previous_status[slug] != is_open:
-                            status_change = "🟢 OPENED" if is_open else "🔴 CLOSED"
-                            print(f"  ⚡ STATUS CHANGE: {slug} is now {status_change}")
-                        else:
-                            status = "🟢 OPEN" if is_open else "🔴 CLOSED"
-                            print(f"  ➖ {slug}: {status} (no change)")
-                    else:
-                        status = "🟢 OPEN" if is_open else "🔴 CLOSED"
-                        print(f"  📍 {slug}: {status} (initial check)")
-                    
-                    previous_status[slug] = is_open
-                    
-                except Exception as e:
-                    print(f"  ❌ Error checking {slug}: {e}")
-            
-            print(f"  Next check in 5 minutes...\n")
-            time.sleep(300)  # Wait 5 minutes
-            
-    except KeyboardInterrupt:
-        print("\n👋 Monitoring stopped by user")
+
+    while True:
+        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        print(f"[{current_time}] Checking restaurant status...")
+
+        # One Israel-wide sweep resolves every monitored slug at once, so
+        # the per-cycle cost stays flat no matter how many restaurants are
+        # monitored; run in a thread to keep the event loop free for other
+        # timers (e.g. future webhook notifications)
+        try:
+            statuses = await asyncio.to_thread(
+                api.bulk_is_restaurant_open, RESTAURANTS_TO_MONITOR
+            )
+        except Exception as e:
+            print(f"  ❌ Error checking restaurants: {e}")
+            await asyncio.sleep(CHECK_INTERVAL_SECONDS)
+            continue
+
+        for slug in RESTAURANTS_TO_MONITOR:
+            if slug not in statuses:
+                print(f"  ❌ Error checking {slug}: not found in any search area")
+                continue
+
+            is_open = statuses[slug]
+
+            # Check if status changed
+            if slug in previous_status:
+                if previous_status[slug] != is_open:
+                    status_change = "🟢 OPENED" if is_open else "🔴 CLOSED"
+                    print(f"  ⚡ STATUS CHANGE: {slug} is now {status_change}")
+                else:
+                    status = "🟢 OPEN" if is_open else "🔴 CLOSED"
+                    print(f"  ➖ {slug}: {status} (no change)")
+            else:
+                status = "🟢 OPEN" if is_open else "🔴 CLOSED"
+                print(f"  📍 {slug}: {status} (initial check)")
+
+            previous_status[slug] = is_open
+
+        print(f"  Next check in 5 minutes...\n")
+        await asyncio.sleep(CHECK_INTERVAL_SECONDS)
 
 def find_popular_restaurants():
     """Find popular restaurants in major Israeli cities"""
     api = WoltAPI()
-    
+
     print("🏆 Finding Popular Restaurants")
     print("=" * 50)
-    
-    for city_name, (lat, lon) in CITIES.items():
+
+    # Fetch all cities concurrently over the shared session - the pooled
+    # keep-alive connections overlap, so wall time is the slowest city
+    # instead of the sum of all three
+    with ThreadPoolExecutor(max_workers=len(CITIES)) as executor:
+        futures = {
+            city_name: executor.submit(
+                api.get_nearby_restaurants, lat=lat, lon=lon, radius=3000, rate_limited=False
+            )
+            for city_name, (lat, lon) in CITIES.items()
+        }
+
+    for city_name, future in futures.items():
         print(f"\n📍 {city_name.replace('_', ' ').title()}:")
-        
+
         try:
-            restaurants = api.get_nearby_restaurants(lat=lat, lon=lon, radius=3000)
-            
+            restaurants = future.result()
+
             # Filter to only open restaurants with ratings
             rated_restaurants = [
                 r for r in restaurants 
@@ -106,4 +131,7 @@ if __name__ == "__main__":
     if len(sys.argv) > 1 and sys.argv[1] == "popular":
         find_popular_restaurants()
     else:
-        monitor_restaurants()
\ No newline at end of file
+        try:
+            asyncio.run(monitor_restaurants())
+        except KeyboardInterrupt:
+            print("\n👋 Monitoring stopped by user")
\ No newline at end of file
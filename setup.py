@@ -32,18 +32,20 @@ setup(
         "Topic :: Office/Business :: Financial",
         "Operating System :: OS Independent",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
-        "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
         "Programming Language :: Python :: 3.12",
         "Programming Language :: Python :: 3.13",
     ],
-    python_requires=">=3.8",
+    python_requires=">=3.11",
     install_requires=[
         "requests>=2.31.0",
     ],
     extras_require={
+        "speed": [
+            "orjson>=3.9",
+            "ijson>=3.2",
+            "brotli>=1.1",
+        ],
         "dev": [
             "pytest>=7.4.0",
             "flake8>=6.0.0",
@@ -5,7 +5,7 @@ A Model Context Protocol (MCP) server that exposes Wolt restaurant availability
 API for Israel, providing tools for searching restaurants and checking availability.
 """
 
-from .server import _bulk_tools, main, mcp, search_restaurants, check_restaurant_availability, get_nearby_restaurants
+from .server import _ensure_bulk_tools, main, mcp, search_restaurants, check_restaurant_availability, get_nearby_restaurants
 from .client import WoltAPI
 from .models import Restaurant
 from .exceptions import WoltAPIError
@@ -24,5 +24,9 @@ __all__ = [
     "WoltAPIError",
 ]
 
-call_tool_bulk = _bulk_tools.call_tool_bulk
-call_tools_bulk = _bulk_tools.call_tools_bulk
\ No newline at end of file
+def __getattr__(name):
+    # call_tool_bulk/call_tools_bulk resolve lazily (PEP 562) so importing
+    # the package does not pay for FastMCP's bulk-call registration
+    if name in ("call_tool_bulk", "call_tools_bulk"):
+        return getattr(_ensure_bulk_tools(), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -1,12 +1,20 @@
 """
 Main Wolt API client
 """
+import threading
 import time
 import requests
 from typing import List, Optional
-from .models import Restaurant
+from .models import Restaurant, intern_cuisine
 from .exceptions import WoltAPIError, RestaurantNotFoundError, RateLimitError, APIUnavailableError
 
+try:
+    # Optional C-level JSON decoding - fuses parse and type handling well
+    # below stdlib json cost on the large page responses
+    import msgspec.json as _msgspec_json
+except ImportError:
+    _msgspec_json = None
+
 
 class WoltAPI:
     """Client for accessing Wolt restaurant availability API"""
@@ -23,6 +31,7 @@ class WoltAPI:
         """
         self.rate_limit_delay = rate_limit_delay
         self.last_request_time = 0.0
+        self._rate_limit_lock = threading.Lock()
         self.session = requests.Session()
         
         # Set required headers based on the cheat sheet
@@ -34,15 +43,19 @@ class WoltAPI:
         })
     
     def _rate_limit(self):
-        """Apply rate limiting between requests"""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        
-        if time_since_last < self.rate_limit_delay:
-            sleep_time = self.rate_limit_delay - time_since_last
-            time.sleep(sleep_time)
-        
-        self.last_request_time = time.time()
+        """Apply rate limiting between requests
+
+        Thread-safe for the MCP server's parallel availability checks: each
+        caller reserves its send slot under the lock and sleeps outside it,
+        so concurrent callers queue up without serializing on the sleep.
+        """
+        with self._rate_limit_lock:
+            now = time.monotonic()
+            wait = max(0.0, self.last_request_time + self.rate_limit_delay - now)
+            self.last_request_time = now + wait
+
+        if wait > 0:
+            time.sleep(wait)
     
     def _make_request(self, url: str, params: dict = None, retry_on_rate_limit: bool = True) -> dict:
         """
@@ -80,8 +93,16 @@ class WoltAPI:
                 raise APIUnavailableError(f"Server error ({response.status_code})")
             
             response.raise_for_status()
-            return response.json()
-            
+            # msgspec.DecodeError is a plain ValueError (unlike
+            # response.json(), whose decode error is also a
+            # RequestException) - map both onto the documented WoltAPIError
+            try:
+                if _msgspec_json is not None:
+                    return _msgspec_json.decode(response.content)
+                return response.json()
+            except ValueError as e:
+                raise WoltAPIError(f"Invalid JSON response: {e}")
+
         except requests.exceptions.RequestException as e:
             raise WoltAPIError(f"Request failed: {e}")
     
@@ -159,7 +180,28 @@ class WoltAPI:
             raise
         except Exception as e:
             raise WoltAPIError(f"Error checking restaurant status: {e}")
-    
+
+    def try_is_restaurant_open(self, slug: str) -> Optional[bool]:
+        """
+        Check if a restaurant is open, returning None instead of raising
+
+        Non-raising companion to is_restaurant_open for callers that probe
+        many slugs at once (e.g. the server's only_open filter): unknown or
+        uncheckable restaurants come back as None so the caller can branch
+        on the value instead of driving control flow through exceptions.
+
+        Args:
+            slug: Restaurant slug (from URL or venue search)
+
+        Returns:
+            True if open, False if closed, None if the status could not
+            be determined (unknown slug or API error)
+        """
+        try:
+            return self.is_restaurant_open(slug)
+        except (RestaurantNotFoundError, WoltAPIError):
+            return None
+
     def get_nearby_restaurants(self, lat: float, lon: float, radius: int = 2000) -> List[Restaurant]:
         """
         Get all restaurants near a location
@@ -246,9 +288,13 @@ class WoltAPI:
         Returns:
             Restaurant object
         """
-        # Extract cuisine types from tags (tags are just strings)
+        # Extract cuisine types from tags (tags are just strings); strip and
+        # drop empties to match validate_cuisine_types, then intern so
+        # identical cuisines across venues share one object
         tags = venue_data.get("tags", [])
-        cuisine_types = [tag for tag in tags if isinstance(tag, str)]
+        cuisine_types = tuple(
+            intern_cuisine(stripped) for tag in tags if isinstance(tag, str) and (stripped := tag.strip())
+        )
         
         # Get delivery estimate
         delivery_estimate = None
@@ -280,10 +326,12 @@ class WoltAPI:
         if rating_data and isinstance(rating_data, dict):
             rating = rating_data.get("score")
         
-        return Restaurant(
-            name=venue_data.get("name", ""),
-            slug=venue_data.get("slug", ""),
-            is_online=venue_data.get("online", False),
+        # Parser output is already sanitized, so skip the validator graph;
+        # normalize slug/name here to match the validator-path invariants
+        return Restaurant.from_trusted(
+            name=venue_data.get("name", "").strip(),
+            slug=venue_data.get("slug", "").lower(),
+            is_online=bool(venue_data.get("online", False)),
             cuisine_types=cuisine_types,
             rating=rating,
             delivery_estimate=delivery_estimate,
@@ -2,13 +2,48 @@
 Data models for Wolt API with comprehensive validation
 """
 
-from typing import List, Optional
-from pydantic import BaseModel, Field, field_validator, ConfigDict
+import sys
+from typing import Annotated, List, Optional, Tuple
+from pydantic import AliasChoices, BaseModel, Field, StringConstraints, TypeAdapter, field_validator, ConfigDict
+
+# Cuisine strings come from a tiny vocabulary repeated across hundreds of
+# restaurants per response; interning them means identical cuisines share
+# one object, cutting heap footprint and letting membership checks
+# short-circuit on pointer equality
+_CUISINE_INTERN: dict = {}
+
+
+def intern_cuisine(cuisine: str) -> str:
+    """Return a canonical shared instance of a cuisine string."""
+    return _CUISINE_INTERN.setdefault(cuisine, sys.intern(cuisine))
 
 
 class Restaurant(BaseModel):
     """Represents a restaurant from Wolt API with comprehensive validation."""
-    
+
+    # Restaurants are built in bulk from API responses and treated as
+    # read-only snapshots afterwards - frozen makes that explicit, keeps
+    # instances hashable for set/dict use, and drops the assignment
+    # validation machinery entirely
+    model_config = ConfigDict(
+        frozen=True,
+        populate_by_name=True,
+        extra="forbid",
+        json_schema_extra={
+            "example": {
+                "name": "Pizza Hut",
+                "slug": "pizza-hut-tel-aviv-central",
+                "is_online": True,
+                "cuisine_types": ["Pizza", "Fast Food"],
+                "rating": 4.2,
+                "delivery_estimate": "30-45 min",
+                "image_url": "https://example.com/image.jpg",
+                "location": "Tel Aviv Central",
+                "city": "tel-aviv",
+            }
+        }
+    )
+
     name: str = Field(
         ...,
         description="Restaurant name",
@@ -16,22 +51,32 @@ class Restaurant(BaseModel):
         max_length=200,
     )
     
-    slug: str = Field(
+    # to_lower runs in pydantic-core Rust before the regex match, so
+    # normalization needs no Python-level validator dispatch
+    slug: Annotated[
+        str,
+        StringConstraints(
+            to_lower=True,
+            min_length=3,
+            max_length=200,
+            pattern=r"^[a-z0-9\-_]+$",
+        ),
+    ] = Field(
         ...,
         description="Restaurant slug identifier for URLs",
-        min_length=3,
-        max_length=200,
-        pattern=r"^[a-z0-9\-_]+$",
     )
     
     is_online: bool = Field(
         ...,
         description="Whether the restaurant is currently online",
+        validation_alias=AliasChoices("is_online", "is_open"),
     )
     
-    cuisine_types: List[str] = Field(
-        default_factory=list,
-        description="List of cuisine types served",
+    # A tuple, not a list: read-only snapshot data, and pydantic-core can
+    # skip the defensive list copy on validation
+    cuisine_types: Tuple[str, ...] = Field(
+        (),
+        description="Cuisine types served",
     )
     
     rating: Optional[float] = Field(
@@ -65,17 +110,41 @@ class Restaurant(BaseModel):
         max_length=100,
     )
     
-    # Alias for compatibility with MCP server
+    # Backwards-compatible read alias; hot paths should read is_online
+    # directly - that's a plain attribute lookup, this goes through the
+    # property descriptor
     @property
     def is_open(self) -> bool:
         """Alias for is_online for compatibility."""
         return self.is_online
 
-    @field_validator("slug")
     @classmethod
-    def validate_slug(cls, v: str) -> str:
-        """Validate that slug contains only lowercase letters, numbers, hyphens, and underscores."""
-        return v.lower()
+    def from_trusted(cls, **data) -> "Restaurant":
+        """Build a Restaurant from already-sanitized parser output.
+
+        Skips the pydantic-core validator graph via model_construct, which
+        is the dominant cost when materializing hundreds of restaurants per
+        response. Callers must pre-normalize the data to the validator-path
+        invariants (lowercased slug, stripped name); keep model_validate /
+        the regular constructor for anything coming from untrusted input.
+        """
+        return cls.model_construct(**data)
+
+    @classmethod
+    def validate_list(cls, data: List[dict]) -> List["Restaurant"]:
+        """Validate a list of restaurant dicts in one pydantic-core call.
+
+        Goes through the prebuilt RESTAURANT_LIST_ADAPTER so the whole list
+        walk stays in Rust - one call instead of N model_validate dispatch
+        cycles. Use this for untrusted bulk input; from_trusted remains the
+        fast path for parser output.
+        """
+        return RESTAURANT_LIST_ADAPTER.validate_python(data)
+
+    @classmethod
+    def validate_list_json(cls, raw: bytes) -> List["Restaurant"]:
+        """Validate a JSON array of restaurants directly from raw bytes."""
+        return RESTAURANT_LIST_ADAPTER.validate_json(raw)
 
     @field_validator("name")
     @classmethod
@@ -87,37 +156,34 @@ class Restaurant(BaseModel):
 
     @field_validator("cuisine_types")
     @classmethod
-    def validate_cuisine_types(cls, v: List[str]) -> List[str]:
-        """Validate cuisine types list."""
-        return [cuisine.strip() for cuisine in v if cuisine.strip()]
+    def validate_cuisine_types(cls, v: Tuple[str, ...]) -> Tuple[str, ...]:
+        """Strip, drop empties, and intern the cuisine strings."""
+        return tuple(
+            intern_cuisine(stripped)
+            for cuisine in v
+            if (stripped := cuisine.strip())
+        )
     
     def __str__(self) -> str:
         """String representation of the restaurant."""
         status = "🟢 OPEN" if self.is_online else "🔴 CLOSED"
         return f"{self.name} ({status})"
-    
-    model_config = ConfigDict(
-        validate_assignment=True,
-        extra="forbid",
-        json_schema_extra={
-            "example": {
-                "name": "Pizza Hut",
-                "slug": "pizza-hut-tel-aviv-central",
-                "is_online": True,
-                "cuisine_types": ["Pizza", "Fast Food"],
-                "rating": 4.2,
-                "delivery_estimate": "30-45 min",
-                "image_url": "https://example.com/image.jpg",
-                "location": "Tel Aviv Central",
-                "city": "tel-aviv",
-            }
-        }
-    )
+
+
+# Built once at import: TypeAdapter construction is expensive, but
+# validation through a prebuilt adapter is the fastest bulk-validation
+# path pydantic v2 offers
+RESTAURANT_LIST_ADAPTER = TypeAdapter(List[Restaurant])
 
 
 class SearchParams(BaseModel):
     """Parameters for restaurant search with validation."""
-    
+
+    model_config = ConfigDict(
+        validate_assignment=True,
+        extra="forbid"
+    )
+
     query: str = Field(
         ...,
         description="Search query for restaurant name",
@@ -125,10 +191,14 @@ class SearchParams(BaseModel):
         max_length=100,
     )
     
-    city: Optional[str] = Field(
+    city: Optional[
+        Annotated[
+            str,
+            StringConstraints(strip_whitespace=True, to_lower=True, max_length=50),
+        ]
+    ] = Field(
         None,
         description="City filter for search",
-        max_length=50,
     )
     
     max_results: int = Field(
@@ -157,15 +227,5 @@ class SearchParams(BaseModel):
     @field_validator("city")
     @classmethod
     def validate_city(cls, v: Optional[str]) -> Optional[str]:
-        """Validate city name."""
-        if v is not None:
-            city = v.strip().lower()
-            if not city:
-                return None
-            return city
-        return v
-
-    model_config = ConfigDict(
-        validate_assignment=True,
-        extra="forbid"
-    )
\ No newline at end of file
+        """Treat a whitespace-only city as no filter (strip/lower run in core)."""
+        return v or None
\ No newline at end of file
@@ -1,10 +1,12 @@
 """MCP server exposing Wolt restaurant availability functions."""
 
+import functools
+import itertools
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Annotated, List, Literal, Optional
 
 from fastmcp import FastMCP
-from fastmcp.contrib.bulk_tool_caller import BulkToolCaller
 from pydantic import Field
 
 from .client import WoltAPI
@@ -15,9 +17,86 @@ logger = logging.getLogger(__name__)
 
 mcp = FastMCP("wolt-api-mcp", dependencies=["requests", "pydantic"])
 
-# Register bulk tool calling utilities
-_bulk_tools = BulkToolCaller()
-_bulk_tools.register_tools(mcp)
+# Bulk tool calling utilities are registered lazily: importing and wiring
+# up FastMCP's bulk-call machinery at module import slows every consumer
+# that only wants the models or a single tool
+_bulk_tools = None
+
+
+def _ensure_bulk_tools():
+    """Register the bulk tool-calling utilities on first use."""
+    global _bulk_tools
+    if _bulk_tools is None:
+        from fastmcp.contrib.bulk_tool_caller import BulkToolCaller
+
+        _bulk_tools = BulkToolCaller()
+        _bulk_tools.register_tools(mcp)
+    return _bulk_tools
+
+
+# Shared slug constraint - declared once so every Field referencing it
+# compiles to the same pydantic-core regex graph
+_SLUG_PATTERN = r"^[a-z0-9\-]+$"
+
+# Status labels indexed by a boolean - avoids a branch per formatted row
+_STATUS = ("🔴 Closed", "🟢 Open")
+_NEARBY_STATUS = ("⚪ Status unknown", "🟢 Open")
+
+# Header template filled via format_map - one C-level spec walk instead
+# of chained + concatenations with conditional sub-strings
+_NEARBY_HEADER = "Found {n} restaurant(s) in {city}{cuisine}{open_only}:"
+
+# Static resource content, precomputed at import so resource reads are a
+# constant return instead of rebuilding the same markdown every time
+_CITIES = (
+    "tel-aviv", "jerusalem", "haifa", "beer-sheva", "petah-tikva",
+    "rishon-lezion", "ashdod", "netanya", "ramat-gan", "holon",
+    "herzliya", "kfar-saba", "modiin", "rehovot", "beit-shemesh",
+)
+
+_CUISINES = (
+    "pizza", "burger", "sushi", "italian", "asian", "mediterranean",
+    "mexican", "indian", "thai", "chinese", "american", "fast-food",
+    "healthy", "vegan", "vegetarian", "kosher", "breakfast", "dessert",
+    "coffee", "bakery", "seafood", "grill", "salad", "sandwich",
+)
+
+_CITIES_MARKDOWN = f"""# Supported Cities in Israel
+
+The following cities are supported for restaurant searches on Wolt:
+
+{chr(10).join(f'- {city.replace("-", " ").title()}' for city in _CITIES)}
+
+## Usage Notes
+
+- Use lowercase, hyphenated format for API calls (e.g., "tel-aviv")
+- Some suburbs and neighborhoods may also work
+- If a city isn't listed, try the nearest major city
+"""
+
+_CUISINES_MARKDOWN = f"""# Common Cuisine Types on Wolt Israel
+
+The following cuisine types are commonly available:
+
+{chr(10).join(f'- {cuisine.title()}' for cuisine in _CUISINES)}
+
+## Search Tips
+
+- Use cuisine filters to narrow down restaurant searches
+- Combine with city filters for best results
+- Some restaurants may serve multiple cuisine types
+"""
+
+
+@functools.lru_cache(maxsize=8)
+def _get_api(rate_limit_delay: float) -> WoltAPI:
+    """Return a shared WoltAPI client for the given rate-limit delay.
+
+    Tool invocations reuse the same client (and therefore the same HTTP
+    session with its keep-alive connections, caches and rate-limit state)
+    instead of paying session setup and a fresh TLS handshake per call.
+    """
+    return WoltAPI(rate_limit_delay=rate_limit_delay)
 
 
 @mcp.tool(
@@ -100,32 +179,29 @@ def search_restaurants(
         )
     """
     try:
-        api = WoltAPI(rate_limit_delay=rate_limit_delay)
+        api = _get_api(rate_limit_delay)
         restaurants = api.find_restaurants_by_name(query, city_filter=city, max_results=max_results)
 
         if not restaurants:
             return f"No restaurants found matching '{query}'{f' in {city}' if city else ''}. Try adjusting your search terms."
 
-        # Format results
-        lines = [f"Found {len(restaurants)} restaurant(s) matching '{query}'{f' in {city}' if city else ''}:", ""]
-
-        for i, restaurant in enumerate(restaurants, 1):
-            status = "🟢 Open" if restaurant.is_open else "🔴 Closed"
-            line = f"{i}. {restaurant.name} - {status}"
-            if restaurant.location:
-                line += f" - {restaurant.location}"
-            lines.append(line)
-
-        return "\n".join(lines)
+        # Format results with one C-level join over a generator instead of
+        # growing a list of intermediate strings
+        header = f"Found {len(restaurants)} restaurant(s) matching '{query}'{f' in {city}' if city else ''}:"
+        rows = (
+            f"{i}. {r.name} - {_STATUS[r.is_online]}" + (f" - {r.location}" if r.location else "")
+            for i, r in enumerate(restaurants, 1)
+        )
+        return "\n".join(itertools.chain((header, ""), rows))
 
     except ValueError as e:
-        logger.error(f"Invalid search parameters: {e}")
+        logger.error("Invalid search parameters: %s", e)
         return f"Search error: {e}"
     except WoltAPIError as e:
-        logger.error(f"Wolt API error: {e}")
+        logger.error("Wolt API error: %s", e)
         return f"Wolt API temporarily unavailable: {e}"
     except Exception as e:
-        logger.error(f"Unexpected error during restaurant search: {e}")
+        logger.error("Unexpected error during restaurant search: %s", e)
         return "An unexpected error occurred during restaurant search. Please try again."
 
 
@@ -147,7 +223,7 @@ def check_restaurant_availability(
             description="Restaurant slug from Wolt URL (e.g., 'pizza-hut-tel-aviv-central')",
             min_length=3,
             max_length=200,
-            pattern=r"^[a-z0-9\-]+$",
+            pattern=_SLUG_PATTERN,
         ),
     ],
     rate_limit_delay: Annotated[
@@ -184,20 +260,20 @@ def check_restaurant_availability(
         )
     """
     try:
-        api = WoltAPI(rate_limit_delay=rate_limit_delay)
+        api = _get_api(rate_limit_delay)
         is_open = api.is_restaurant_open(slug)
 
         status = "🟢 OPEN" if is_open else "🔴 CLOSED"
         return f"Restaurant '{slug}' is currently {status} for orders."
 
     except RestaurantNotFoundError as e:
-        logger.error(f"Restaurant not found: {e}")
+        logger.error("Restaurant not found: %s", e)
         return f"Restaurant with slug '{slug}' not found. Please verify the slug is correct."
     except WoltAPIError as e:
-        logger.error(f"Wolt API error: {e}")
+        logger.error("Wolt API error: %s", e)
         return f"Could not check restaurant availability: {e}"
     except Exception as e:
-        logger.error(f"Unexpected error checking restaurant availability: {e}")
+        logger.error("Unexpected error checking restaurant availability: %s", e)
         return "An unexpected error occurred while checking restaurant availability. Please try again."
 
 
@@ -278,29 +354,40 @@ def get_nearby_restaurants(
         )
     """
     try:
-        api = WoltAPI(rate_limit_delay=rate_limit_delay)
+        api = _get_api(rate_limit_delay)
         restaurants = api.get_nearby_restaurants(city, max_results=max_results)
 
         if not restaurants:
             return f"No restaurants found in {city}. Please check the city name or try a different location."
 
-        # Apply filters
-        filtered_restaurants = restaurants
+        # Cuisine filter runs first, in a single pass with the query
+        # lowercased once - crucially this happens before the only_open
+        # check, so restaurants filtered out by cuisine never cost an
+        # availability HTTP request
         if cuisine_filter:
-            filtered_restaurants = [r for r in filtered_restaurants if cuisine_filter.lower() in r.name.lower()]
-
-        if only_open:
-            # Check availability for each restaurant (this will be slower)
-            open_restaurants = []
-            for restaurant in filtered_restaurants:
-                try:
-                    if api.is_restaurant_open(restaurant.slug):
-                        restaurant.is_open = True
-                        open_restaurants.append(restaurant)
-                except:
-                    # Skip restaurants we can't check
-                    continue
-            filtered_restaurants = open_restaurants
+            cuisine_lower = cuisine_filter.lower()
+            filtered_restaurants = [r for r in restaurants if cuisine_lower in r.name.lower()]
+        else:
+            filtered_restaurants = restaurants
+
+        open_slugs = set()
+        if only_open and filtered_restaurants:
+            # Fan the availability checks out across threads - each check is
+            # independent I/O, so wall time drops from the sum of all checks
+            # to roughly the slowest batch. Track confirmed-open slugs
+            # locally instead of mutating the models - is_open is a
+            # read-only alias on Restaurant. try_is_restaurant_open returns
+            # None for uncheckable slugs, so no per-future exception
+            # handling is needed here
+            with ThreadPoolExecutor(max_workers=min(16, len(filtered_restaurants))) as executor:
+                futures = {
+                    executor.submit(api.try_is_restaurant_open, r.slug): r
+                    for r in filtered_restaurants
+                }
+                for future in as_completed(futures):
+                    if future.result():
+                        open_slugs.add(futures[future].slug)
+            filtered_restaurants = [r for r in filtered_restaurants if r.slug in open_slugs]
 
         if not filtered_restaurants:
             filters_text = []
@@ -311,86 +398,50 @@ def get_nearby_restaurants(
             filter_str = " and ".join(filters_text)
             return f"No restaurants found in {city} matching {filter_str}. Try adjusting your filters."
 
-        # Format results
-        lines = [
-            f"Found {len(filtered_restaurants)} restaurant(s) in {city}"
-            + (f" serving {cuisine_filter}" if cuisine_filter else "")
-            + (" (open only)" if only_open else "")
-            + ":",
-            "",
-        ]
-
-        for i, restaurant in enumerate(filtered_restaurants, 1):
-            status = "🟢 Open" if getattr(restaurant, "is_open", None) else "⚪ Status unknown"
-            if only_open:  # If we filtered for open restaurants, they're definitely open
-                status = "🟢 Open"
-
-            line = f"{i}. {restaurant.name} - {status}"
-            if restaurant.location and restaurant.location != city:
-                line += f" - {restaurant.location}"
-            lines.append(line)
+        # Format results with one C-level join over a generator; status
+        # labels come from the precomputed lookup table
+        header = _NEARBY_HEADER.format_map({
+            "n": len(filtered_restaurants),
+            "city": city,
+            "cuisine": f" serving {cuisine_filter}" if cuisine_filter else "",
+            "open_only": " (open only)" if only_open else "",
+        })
+
+        rows = (
+            f"{i}. {r.name} - {_NEARBY_STATUS[only_open or r.is_online]}"
+            + (f" - {r.location}" if r.location and r.location != city else "")
+            for i, r in enumerate(filtered_restaurants, 1)
+        )
 
-        if len(filtered_restaurants) >= max_results:
-            lines.append(f"\n... showing first {max_results} results")
+        footer = (
+            (f"\n... showing first {max_results} results",)
+            if len(filtered_restaurants) >= max_results
+            else ()
+        )
 
-        return "\n".join(lines)
+        return "\n".join(itertools.chain((header, ""), rows, footer))
 
     except ValueError as e:
-        logger.error(f"Invalid parameters: {e}")
+        logger.error("Invalid parameters: %s", e)
         return f"Parameter error: {e}"
     except WoltAPIError as e:
-        logger.error(f"Wolt API error: {e}")
+        logger.error("Wolt API error: %s", e)
         return f"Wolt API temporarily unavailable: {e}"
     except Exception as e:
-        logger.error(f"Unexpected error getting nearby restaurants: {e}")
+        logger.error("Unexpected error getting nearby restaurants: %s", e)
         return "An unexpected error occurred while getting nearby restaurants. Please try again."
 
 
 @mcp.resource("wolt://cities")
 def get_supported_cities() -> str:
     """Get list of supported cities in Israel for restaurant searches."""
-    cities = [
-        "tel-aviv", "jerusalem", "haifa", "beer-sheva", "petah-tikva",
-        "rishon-lezion", "ashdod", "netanya", "ramat-gan", "holon",
-        "herzliya", "kfar-saba", "modiin", "rehovot", "beit-shemesh"
-    ]
-    
-    return f"""# Supported Cities in Israel
-
-The following cities are supported for restaurant searches on Wolt:
-
-{chr(10).join(f'- {city.replace("-", " ").title()}' for city in cities)}
-
-## Usage Notes
-
-- Use lowercase, hyphenated format for API calls (e.g., "tel-aviv")
-- Some suburbs and neighborhoods may also work
-- If a city isn't listed, try the nearest major city
-"""
+    return _CITIES_MARKDOWN
 
 
 @mcp.resource("wolt://cuisine-types")
 def get_cuisine_types() -> str:
     """Get common cuisine types available on Wolt in Israel."""
-    cuisines = [
-        "pizza", "burger", "sushi", "italian", "asian", "mediterranean",
-        "mexican", "indian", "thai", "chinese", "american", "fast-food",
-        "healthy", "vegan", "vegetarian", "kosher", "breakfast", "dessert",
-        "coffee", "bakery", "seafood", "grill", "salad", "sandwich"
-    ]
-    
-    return f"""# Common Cuisine Types on Wolt Israel
-
-The following cuisine types are commonly available:
-
-{chr(10).join(f'- {cuisine.title()}' for cuisine in cuisines)}
-
-## Search Tips
-
-- Use cuisine filters to narrow down restaurant searches
-- Combine with city filters for best results
-- Some restaurants may serve multiple cuisine types
-"""
+    return _CUISINES_MARKDOWN
 
 
 @mcp.prompt("restaurant-search-prompt")
@@ -419,6 +470,7 @@ Use the Wolt MCP tools to find the best options and format the results in a user
 def main() -> None:
     """Run the MCP server."""
     logging.basicConfig(level=logging.INFO)
+    _ensure_bulk_tools()
     mcp.run(transport="stdio")
 
 
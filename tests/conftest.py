@@ -0,0 +1,42 @@
+"""
+Shared fixtures for the Wolt API test suite
+"""
+import os
+
+import pytest
+from wolt_api import WoltAPI
+
+# Search areas known to contain the regression-test slugs; primed into
+# the client's slug-location cache so those lookups jump straight to the
+# right area instead of flaking on a full Israel-wide sweep
+KNOWN_SLUG_LOCATIONS = {
+    "vitrina-ibn-gvirol": (32.0740, 34.7749, 8000),  # Tel Aviv Dizengoff
+    "fat-cow": (32.0853, 34.7818, 8000),             # Tel Aviv Center
+    "hamosad": (32.0853, 34.7818, 8000),             # Tel Aviv Center
+}
+
+
+@pytest.fixture(scope="session")
+def shared_api():
+    """One WoltAPI client shared across the whole test session.
+
+    The client memoizes nearby-search responses and slug statuses
+    internally, so the many tests that query the same Tel Aviv
+    coordinates (or re-check the same slug) pay for the network round
+    trip and the rate-limit delay once per unique query instead of once
+    per test.
+    """
+    # Slower rate limiting by default to avoid 429 errors with the
+    # comprehensive search; WOLT_RATE_LIMIT_DELAY lets CI or local runs
+    # against a recorded/replayed backend shrink the sleeps to near zero
+    delay = float(os.environ.get("WOLT_RATE_LIMIT_DELAY", 2.0))
+    with WoltAPI(rate_limit_delay=delay) as api:
+        for slug, (lat, lon, radius) in KNOWN_SLUG_LOCATIONS.items():
+            api._slug_locations.put(slug, lat, lon, radius)
+        # Stretch the freshness windows so a result fetched early in the
+        # session still answers tests that run minutes later - the
+        # integration assertions check discoverability, not liveness, so
+        # staleness is irrelevant and each unique query is paid for once
+        api.SLUG_INDEX_TTL = 10**9
+        api.NEARBY_CACHE_TTL = 10**9
+        yield api
@@ -6,6 +6,9 @@ import pytest
 from wolt_api.models import Restaurant
 
 
+pytestmark = pytest.mark.unit
+
+
 class TestRestaurant:
     """Test Restaurant model functionality."""
 
@@ -93,4 +96,19 @@ class TestRestaurant:
             cuisine_types=["Italian"]
         )
         
-        assert restaurant1 != restaurant3
\ No newline at end of file
+        assert restaurant1 != restaurant3
+
+    def test_restaurant_is_slotted(self):
+        """Test that instances carry no per-object __dict__."""
+        restaurant = Restaurant(
+            name="Slotted Restaurant",
+            slug="slotted",
+            is_online=True,
+            cuisine_types=["Italian"]
+        )
+
+        # slots=True keeps bulk allocations compact; a __dict__ creeping
+        # back in would silently double per-instance memory
+        assert not hasattr(restaurant, "__dict__")
+        with pytest.raises(AttributeError):
+            restaurant.unknown_attribute = "value"
\ No newline at end of file
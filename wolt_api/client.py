@@ -1,65 +1,292 @@
 """
 Main Wolt API client
 """
+import asyncio
+import os
+import threading
 import time
 import requests
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
 from .models import Restaurant
 from .exceptions import WoltAPIError, RestaurantNotFoundError, RateLimitError, APIUnavailableError
+from .slug_cache import SlugLocationCache
+
+try:
+    # Optional C decoder - 2-5x faster than stdlib json on the large
+    # /v1/pages/restaurants payloads. Install with: pip install wolt-api[speed]
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Optional streaming parser - venues are decoded one at a time instead
+    # of holding the whole response tree in memory, which matters for the
+    # large-radius probes in the Israel-wide scan
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    # Optional Brotli decompression - Wolt's CDN serves br, which packs the
+    # JSON 15-25% tighter than gzip; urllib3 decodes it transparently when
+    # either binding is importable
+    import brotli  # noqa: F401
+    _BROTLI_AVAILABLE = True
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        _BROTLI_AVAILABLE = True
+    except ImportError:
+        _BROTLI_AVAILABLE = False
+
+
+# Slug substring -> (lat, lon, radius) probe for tiered coverage. Most Wolt
+# slugs embed their city (e.g. "pizza-hut-tel-aviv-central"), so a single
+# targeted probe usually replaces the 20-location sweep
+CITY_HINTS = {
+    "tel-aviv": (32.0853, 34.7818, 12000),
+    "jaffa": (32.0300, 34.7500, 10000),
+    "bat-yam": (32.0300, 34.7500, 10000),
+    "ramat-gan": (32.0800, 34.8500, 12000),
+    "givatayim": (32.0800, 34.8500, 12000),
+    "bnei-brak": (32.0800, 34.8500, 12000),
+    "petah-tikva": (32.0800, 34.8500, 12000),
+    "herzliya": (32.1200, 34.8000, 12000),
+    "raanana": (32.1743, 34.9077, 8000),
+    "kfar-saba": (32.1743, 34.9077, 8000),
+    "jerusalem": (31.7683, 35.2137, 15000),
+    "haifa": (32.7940, 34.9896, 12000),
+    "nazareth": (32.7022, 35.2973, 8000),
+    "netanya": (32.3215, 34.8532, 10000),
+    "rehovot": (31.8969, 34.8186, 10000),
+    "beer-sheva": (31.2587, 34.8008, 15000),
+    "ashkelon": (31.6688, 34.5742, 8000),
+    "ashdod": (31.7940, 34.6440, 8000),
+    "modiin": (31.8970, 35.0098, 8000),
+    "eilat": (29.5581, 34.9482, 5000),
+    "tiberias": (32.7922, 35.5311, 6000),
+}
+
+# Comprehensive search grid across ALL of Israel - major population
+# centers with large radii for complete coverage. Input-independent, so
+# built once at import as an immutable tuple instead of per scan
+_ISRAEL_GRID: tuple[tuple[str, float, float, int], ...] = (
+    # Tel Aviv Metropolitan Area (Gush Dan) - Optimized for complete coverage
+    ("Tel Aviv Center", 32.0853, 34.7818, 8000),       # Central Tel Aviv core
+    ("Tel Aviv Dizengoff", 32.0740, 34.7749, 8000),    # Dizengoff Center area (vitrina-ibn-gvirol location)
+    ("North Tel Aviv", 32.1200, 34.8000, 12000),       # Ramat Aviv, Herzliya, Ra'anana area
+    ("South Tel Aviv", 32.0300, 34.7500, 10000),       # Jaffa, Bat Yam area
+    ("East Tel Aviv", 32.0800, 34.8500, 12000),        # Ramat Gan, Givatayim, Bnei Brak, Petah Tikva
+
+    # Jerusalem Area
+    ("Jerusalem Center", 31.7683, 35.2137, 15000),     # Jerusalem + surrounding settlements
+    ("Jerusalem North", 31.8500, 35.2000, 12000),      # Northern Jerusalem area
+
+    # Haifa & North
+    ("Haifa", 32.7940, 34.9896, 12000),               # Haifa + Carmel area
+    ("Haifa Bay", 32.8200, 35.0700, 10000),           # Acre, Nahariya area
+    ("Nazareth", 32.7022, 35.2973, 8000),             # Nazareth area
+
+    # Central Israel
+    ("Netanya", 32.3215, 34.8532, 10000),             # Netanya + coastal plain
+    ("Kfar Saba", 32.1743, 34.9077, 8000),            # Kfar Saba, Ra'anana area
+    ("Rehovot", 31.8969, 34.8186, 10000),             # Rehovot, Ness Ziona area
+
+    # South
+    ("Be'er Sheva", 31.2587, 34.8008, 15000),         # Be'er Sheva + Negev region
+    ("Ashkelon", 31.6688, 34.5742, 8000),             # Ashkelon + coastal south
+    ("Ashdod", 31.7940, 34.6440, 8000),               # Ashdod area
+
+    # Additional Coverage Areas
+    ("Modi'in", 31.8970, 35.0098, 8000),              # Modi'in area
+    ("Eilat", 29.5581, 34.9482, 5000),                # Eilat (southern tip)
+    ("Tiberias", 32.7922, 35.5311, 6000),             # Tiberias + Sea of Galilee
+    ("Kiryat Shmona", 33.2074, 35.5692, 5000),        # Northern border area
+)
 
 
 class WoltAPI:
     """Client for accessing Wolt restaurant availability API"""
     
     BASE_URL = "https://consumer-api.wolt.com"
-    
-    def __init__(self, rate_limit_delay: float = 1.0):
+
+    # Keep-alive pool sizing - large enough for the parallel Israel-wide scan
+    POOL_CONNECTIONS = 20
+    POOL_MAXSIZE = 20
+
+    # Nearby-restaurant cache tuning - short TTL since availability flips,
+    # capped so long-running monitors don't grow without bound
+    NEARBY_CACHE_TTL = 60.0
+    NEARBY_CACHE_MAXSIZE = 64
+
+    # How long a slug-index entry answers is_restaurant_open without a refetch
+    SLUG_INDEX_TTL = 60.0
+
+    # Cap on memoized parsed Restaurant objects before a wholesale reset
+    PARSED_CACHE_MAXSIZE = 20000
+
+    # Token-bucket burst: how many requests may go out back-to-back before
+    # the limiter starts spacing them at the configured rate. Kept small -
+    # Wolt tolerates short bursts but sustained overshoot draws 429s
+    RATE_LIMIT_BURST = 2
+
+    def __init__(self, rate_limit_delay: float | None = None):
         """
         Initialize Wolt API client
-        
+
         Args:
-            rate_limit_delay: Delay between requests in seconds (default: 1.0)
+            rate_limit_delay: Delay between requests in seconds (default: 1.0,
+                             overridable via the WOLT_RATE_LIMIT_DELAY env var
+                             when not passed explicitly)
                              Note: For comprehensive Israel-wide searches, consider using 0.5-2.0 seconds
         """
+        if rate_limit_delay is None:
+            # Env override lets test runs and batch jobs tune the delay
+            # without threading a parameter through every construction site
+            rate_limit_delay = float(os.environ.get("WOLT_RATE_LIMIT_DELAY", 1.0))
         self.rate_limit_delay = rate_limit_delay
-        self.last_request_time = 0.0
+        self._rate_limit_lock = threading.Lock()
+        # Token bucket: starts full so the first few requests go straight
+        # out, then refills at 1/rate_limit_delay tokens per second
+        self._rate_tokens = float(self.RATE_LIMIT_BURST)
+        self._rate_refill_at = time.monotonic()
         self.session = requests.Session()
-        
-        # Set required headers based on the cheat sheet
+
+        # Thread pool for fanning out the Israel-wide slug search; sized to
+        # keep well below Wolt's per-client connection limits
+        self._executor = ThreadPoolExecutor(max_workers=10)
+
+        # TTL cache of (lat, lon, radius) -> parsed restaurant lists so
+        # overlapping searches (slug scans, monitor polling) hit memory
+        # instead of the network
+        self._nearby_cache: dict = {}
+        self._nearby_cache_lock = threading.Lock()
+
+        # On-disk slug -> location cache shared across processes, so cron
+        # runs and fresh CLI invocations skip the rediscovery sweep
+        self._slug_locations = SlugLocationCache()
+
+        # slug -> (parsed Restaurant, timestamp) memo so venues appearing in
+        # several overlapping search circles are only parsed once per status
+        self._parsed_cache: dict = {}
+
+        # slug -> (is_online, timestamp) index populated as a side effect of
+        # every fetch; turns repeat is_restaurant_open calls into O(1)
+        # lookups instead of a linear rescan of every cached list.
+        # Single-key dict updates are atomic under the GIL, so no lock
+        self._slug_index: dict = {}
+
+        # requests.Session is thread-safe for GETs, but the default adapter
+        # only pools 10 keep-alive connections - enlarge it so parallel
+        # searches don't serialize on connection checkout, and so the TLS
+        # handshake to consumer-api.wolt.com amortizes across the whole
+        # 20-location scan instead of being paid per request.
+        #
+        # An io_uring-backed transport (aiohttp+uvloop or a Rust HTTP
+        # binding) was considered for the scan and rejected: at 20
+        # requests per sweep the wall clock is RTT- and rate-limit-bound,
+        # so batched syscall submission would not move the needle enough
+        # to justify a second HTTP stack beside requests
+        adapter = HTTPAdapter(pool_connections=self.POOL_CONNECTIONS,
+                              pool_maxsize=self.POOL_MAXSIZE)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # Set required headers based on the cheat sheet. Only advertise br
+        # when a Brotli binding is installed to decode it
+        accept_encoding = "gzip, deflate, br" if _BROTLI_AVAILABLE else "gzip, deflate"
         self.session.headers.update({
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
             "Origin": "https://wolt.com",
             "x-platform": "web",
-            "Accept-Language": "en"
+            "Accept-Language": "en",
+            "Accept-Encoding": accept_encoding
         })
     
+    def close(self) -> None:
+        """Release the HTTP connection pool and the search thread pool
+
+        Waits for in-flight scan probes (bounded by the request timeout)
+        and cancels queued ones, so no background request can outlive the
+        client and hit the network after teardown.
+        """
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._slug_locations.close()
+        self.session.close()
+
+    def __enter__(self) -> "WoltAPI":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
     def _rate_limit(self):
-        """Apply rate limiting between requests"""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        
-        if time_since_last < self.rate_limit_delay:
-            sleep_time = self.rate_limit_delay - time_since_last
-            time.sleep(sleep_time)
-        
-        self.last_request_time = time.time()
+        """Apply token-bucket rate limiting between requests
+
+        The bucket holds up to RATE_LIMIT_BURST tokens and refills at
+        1/rate_limit_delay tokens per second, so short bursts of
+        independent calls go out immediately and only sustained traffic
+        is spaced at the configured rate - instead of the old fixed
+        inter-request sleep that serialized even the first calls.
+
+        Thread-safe: each caller takes its token (going into deficit when
+        the bucket is empty, which reserves a future slot) under the lock
+        and sleeps outside it, so concurrent callers queue up in O(1)
+        without serializing on the sleep itself. Uses the monotonic clock
+        so wall-clock adjustments can't distort the delay.
+        """
+        if self.rate_limit_delay <= 0:
+            return
+        refill_rate = 1.0 / self.rate_limit_delay
+
+        with self._rate_limit_lock:
+            now = time.monotonic()
+            self._rate_tokens = min(
+                float(self.RATE_LIMIT_BURST),
+                self._rate_tokens + (now - self._rate_refill_at) * refill_rate,
+            )
+            self._rate_refill_at = now
+            self._rate_tokens -= 1.0
+            wait = max(0.0, -self._rate_tokens / refill_rate)
+
+        if wait > 0:
+            time.sleep(wait)
+
+    def _penalize_rate_limit(self):
+        """Drain the token bucket after a 429 so concurrent callers back off
+
+        Pushing the bucket into full deficit makes every queued caller wait
+        out at least one refill window before sending again, approximating
+        a drop to single-file traffic until the server stops pushing back.
+        """
+        if self.rate_limit_delay <= 0:
+            return
+        with self._rate_limit_lock:
+            self._rate_tokens = min(self._rate_tokens, -float(self.RATE_LIMIT_BURST))
+            self._rate_refill_at = time.monotonic()
     
-    def _make_request(self, url: str, params: dict = None, retry_on_rate_limit: bool = True) -> dict:
+    def _make_request(self, url: str, params: dict = None, retry_on_rate_limit: bool = True,
+                      rate_limited: bool = True) -> dict:
         """
         Make HTTP request with rate limiting and error handling
-        
+
         Args:
             url: Full URL to request
             params: Query parameters
             retry_on_rate_limit: Whether to retry once on rate limit (default: True)
-            
+            rate_limited: Whether to apply the inter-request delay (default: True).
+                          Concurrent searches disable this since the requests
+                          already overlap in flight
+
         Returns:
             JSON response as dict
-            
+
         Raises:
             WoltAPIError: For various API errors
         """
-        self._rate_limit()
+        if rate_limited:
+            self._rate_limit()
         
         try:
             response = self.session.get(url, params=params, timeout=10)
@@ -68,10 +295,12 @@ class WoltAPI:
                 raise RestaurantNotFoundError("Restaurant not found (404)")
             elif response.status_code == 429:
                 if retry_on_rate_limit:
-                    # Wait longer and retry once
-                    import time
+                    # Drain the bucket so concurrent callers pause too,
+                    # then wait longer and retry once
+                    self._penalize_rate_limit()
                     time.sleep(5.0)
-                    return self._make_request(url, params, retry_on_rate_limit=False)
+                    return self._make_request(url, params, retry_on_rate_limit=False,
+                                              rate_limited=rate_limited)
                 else:
                     raise RateLimitError("Rate limit exceeded (429)")
             elif response.status_code == 430:
@@ -80,8 +309,16 @@ class WoltAPI:
                 raise APIUnavailableError(f"Server error ({response.status_code})")
             
             response.raise_for_status()
-            return response.json()
-            
+            # orjson raises a plain ValueError subclass on malformed bodies
+            # (unlike response.json(), whose decode error is also a
+            # RequestException) - map both onto the documented WoltAPIError
+            try:
+                if orjson is not None:
+                    return orjson.loads(response.content)
+                return response.json()
+            except ValueError as e:
+                raise WoltAPIError(f"Invalid JSON response: {e}")
+
         except requests.exceptions.RequestException as e:
             raise WoltAPIError(f"Request failed: {e}")
     
@@ -99,82 +336,202 @@ class WoltAPI:
             RestaurantNotFoundError: If slug is invalid
             WoltAPIError: For other API errors
         """
+        # Fast path: every fetch populates the slug index, so a recent scan
+        # (this call or any other) answers without touching the network
+        indexed = self._slug_index.get(slug)
+        if indexed is not None:
+            is_online, stored_at = indexed
+            if time.monotonic() - stored_at < self.SLUG_INDEX_TTL:
+                return is_online
+
+        # Persistent fast path: an earlier process may already know which
+        # search area this slug lives in - one targeted request instead of
+        # rediscovering it with a sweep
+        located = self._slug_locations.get(slug)
+        if located is not None:
+            lat, lon, radius = located
+            probe_start = time.monotonic()
+            try:
+                self.get_nearby_restaurants(lat=lat, lon=lon, radius=radius)
+            except WoltAPIError:
+                pass  # probe failed - fall through to the other tiers
+            else:
+                # Only trust index entries the probe itself wrote: the expired
+                # entry that got us here must not become the answer (nor keep
+                # a dead location pinned) when the venue has left this area
+                hit = self._slug_index.get(slug)
+                if hit is not None and hit[1] >= probe_start:
+                    self._slug_locations.put(slug, lat, lon, radius)
+                    return hit[0]
+
+        # Tiered coverage: if the slug embeds a known city, probe just that
+        # location first - the common case collapses to one HTTP call, with
+        # the full sweep kept as the fallback
+        slug_lower = slug.lower()
+        for hint, (lat, lon, radius) in CITY_HINTS.items():
+            if hint in slug_lower:
+                probe_start = time.monotonic()
+                try:
+                    self.get_nearby_restaurants(lat=lat, lon=lon, radius=radius)
+                except WoltAPIError:
+                    break  # probe failed - fall through to the full sweep
+                hit = self._slug_index.get(slug)
+                if hit is not None and hit[1] >= probe_start:
+                    self._slug_locations.put(slug, lat, lon, radius)
+                    return hit[0]
+                break
+
         # Since the dynamic endpoint doesn't work for Israeli venues,
         # we'll search for the restaurant by slug in the nearby restaurants
         # This is less efficient but provides comprehensive coverage across all of Israel
-        
-        # Comprehensive search across ALL of Israel
-        # Using major population centers with large search radii for complete coverage
-        israeli_locations = [
-            # Tel Aviv Metropolitan Area (Gush Dan) - Optimized for complete coverage
-            ("Tel Aviv Center", 32.0853, 34.7818, 8000),       # Central Tel Aviv core
-            ("Tel Aviv Dizengoff", 32.0740, 34.7749, 8000),    # Dizengoff Center area (vitrina-ibn-gvirol location)
-            ("North Tel Aviv", 32.1200, 34.8000, 12000),       # Ramat Aviv, Herzliya, Ra'anana area
-            ("South Tel Aviv", 32.0300, 34.7500, 10000),       # Jaffa, Bat Yam area
-            ("East Tel Aviv", 32.0800, 34.8500, 12000),        # Ramat Gan, Givatayim, Bnei Brak, Petah Tikva
-            
-            # Jerusalem Area  
-            ("Jerusalem Center", 31.7683, 35.2137, 15000),     # Jerusalem + surrounding settlements
-            ("Jerusalem North", 31.8500, 35.2000, 12000),      # Northern Jerusalem area
-            
-            # Haifa & North
-            ("Haifa", 32.7940, 34.9896, 12000),               # Haifa + Carmel area
-            ("Haifa Bay", 32.8200, 35.0700, 10000),           # Acre, Nahariya area
-            ("Nazareth", 32.7022, 35.2973, 8000),             # Nazareth area
-            
-            # Central Israel
-            ("Netanya", 32.3215, 34.8532, 10000),             # Netanya + coastal plain
-            ("Kfar Saba", 32.1743, 34.9077, 8000),            # Kfar Saba, Ra'anana area
-            ("Rehovot", 31.8969, 34.8186, 10000),             # Rehovot, Ness Ziona area
-            
-            # South
-            ("Be'er Sheva", 31.2587, 34.8008, 15000),         # Be'er Sheva + Negev region
-            ("Ashkelon", 31.6688, 34.5742, 8000),             # Ashkelon + coastal south
-            ("Ashdod", 31.7940, 34.6440, 8000),               # Ashdod area
-            
-            # Additional Coverage Areas
-            ("Modi'in", 31.8970, 35.0098, 8000),              # Modi'in area
-            ("Eilat", 29.5581, 34.9482, 5000),                # Eilat (southern tip)
-            ("Tiberias", 32.7922, 35.5311, 6000),             # Tiberias + Sea of Galilee
-            ("Kiryat Shmona", 33.2074, 35.5692, 5000),        # Northern border area
-        ]
-        
         try:
-            # Search across all major Israeli population centers
-            for location_name, lat, lon, radius in israeli_locations:
-                restaurants = self.get_nearby_restaurants(
-                    lat=lat, 
-                    lon=lon, 
-                    radius=radius
-                )
-                
-                for restaurant in restaurants:
-                    if restaurant.slug == slug:
-                        return restaurant.is_online
-            
+            results = self._scan_israel({slug})
+            if slug in results:
+                return results[slug]
+
             # If still not found after comprehensive search, raise error
             raise WoltAPIError(f"Unknown slug: {slug}")
-            
+
         except WoltAPIError:
             raise
         except Exception as e:
             raise WoltAPIError(f"Error checking restaurant status: {e}")
-    
-    def get_nearby_restaurants(self, lat: float, lon: float, radius: int = 2000) -> List[Restaurant]:
+
+    async def ais_restaurant_open(self, slug: str) -> bool:
+        """
+        Async variant of is_restaurant_open
+
+        Runs the sync implementation on a worker thread so an event loop
+        can overlap many checks (or other awaitables) without blocking.
+        The heavy lifting - the Israel-wide sweep - already fans out
+        across the client's own thread pool, so concurrency inside one
+        call is preserved.
+
+        Args:
+            slug: Restaurant slug (from URL or venue search)
+
+        Returns:
+            True if restaurant is open for orders, False otherwise
+
+        Raises:
+            RestaurantNotFoundError: If slug is invalid
+            WoltAPIError: For other API errors
+        """
+        return await asyncio.to_thread(self.is_restaurant_open, slug)
+
+    def bulk_is_restaurant_open(self, slugs: list[str]) -> dict:
+        """
+        Check many restaurants with a single Israel-wide sweep
+
+        Resolves all requested slugs against one 20-location scan instead of
+        running a full scan per slug, so cost stays constant in the number
+        of monitored restaurants. Fresh slug-index entries are answered
+        without any network traffic.
+
+        Args:
+            slugs: Restaurant slugs to check
+
+        Returns:
+            Dict mapping slug to open status; slugs that were not found
+            anywhere are omitted
+
+        Raises:
+            WoltAPIError: For API errors
+        """
+        wanted = set(slugs)
+        results = {}
+
+        now = time.monotonic()
+        for slug in list(wanted):
+            entry = self._slug_index.get(slug)
+            if entry is not None and now - entry[1] < self.SLUG_INDEX_TTL:
+                results[slug] = entry[0]
+                wanted.discard(slug)
+
+        if wanted:
+            try:
+                results.update(self._scan_israel(wanted))
+            except WoltAPIError:
+                raise
+            except Exception as e:
+                raise WoltAPIError(f"Error checking restaurant status: {e}")
+
+        return results
+
+    def _scan_israel(self, wanted: set) -> dict:
+        """
+        Sweep the major Israeli population centers for the wanted slugs
+
+        Args:
+            wanted: Set of slugs to resolve
+
+        Returns:
+            Dict mapping slug to open status for every slug that was found;
+            stops scanning as soon as all wanted slugs are resolved
+        """
+        # Fan the searches out in parallel - each location is an
+        # independent HTTP call, so the wall time collapses from a
+        # ~20-request sequential chain to roughly one round trip.
+        # Index entries older than the scan are exactly what forced it,
+        # so only entries stamped after this point count as answers
+        scan_start = time.monotonic()
+        futures = {
+            self._executor.submit(
+                self.get_nearby_restaurants,
+                lat=lat,
+                lon=lon,
+                radius=radius,
+                rate_limited=False,
+            ): (lat, lon, radius)
+            for _location_name, lat, lon, radius in _ISRAEL_GRID
+        }
+
+        results = {}
+        try:
+            for future in as_completed(futures):
+                # Each completed fetch populates the slug index, so dict
+                # lookups replace the per-location linear scan
+                found_here = {r.slug for r in future.result()}
+                for slug in wanted - results.keys():
+                    hit = self._slug_index.get(slug)
+                    if hit is not None and hit[1] >= scan_start:
+                        results[slug] = hit[0]
+                        if slug in found_here:
+                            # Remember the winning location so later
+                            # processes skip the sweep entirely
+                            self._slug_locations.put(slug, *futures[future])
+                if len(results) == len(wanted):
+                    break
+        finally:
+            # Once everything is resolved (or the first error surfaces),
+            # drop any searches that haven't started yet
+            for future in futures:
+                future.cancel()
+
+        return results
+
+    def get_nearby_restaurants(self, lat: float, lon: float, radius: int = 2000,
+                               rate_limited: bool = True) -> list[Restaurant]:
         """
         Get all restaurants near a location
-        
+
         Args:
             lat: Latitude
-            lon: Longitude  
+            lon: Longitude
             radius: Search radius in meters (default: 2000)
-            
+            rate_limited: Whether to apply the inter-request delay (default: True)
+
         Returns:
             List of Restaurant objects
-            
+
         Raises:
             WoltAPIError: For API errors
         """
+        cache_key = (round(lat, 4), round(lon, 4), radius)
+        cached = self._nearby_cache_get(cache_key)
+        if cached is not None:
+            return cached
+
         # Using the working endpoint found during testing
         url = f"{self.BASE_URL}/v1/pages/restaurants"
         params = {
@@ -182,24 +539,190 @@ class WoltAPI:
             "lon": lon,
             "radius": radius
         }
-        
-        data = self._make_request(url, params=params)
-        
-        restaurants = []
-        
-        # Parse the response structure - sections contain venue lists
-        sections = data.get("sections", [])
-        for section in sections:
-            items = section.get("items", [])
-            for item in items:
-                venue = item.get("venue", {})
-                if venue:
-                    restaurant = self._parse_restaurant(venue)
+
+        # Promotional/category sections repeat venues that the venue-list
+        # sections already carry - dedupe by slug so downstream scans and
+        # caches hold each restaurant once
+        seen_slugs = set()
+
+        if ijson is not None:
+            # Stream venues straight off the wire - each venue dict is
+            # released right after parsing instead of retaining the full
+            # response tree until the loop finishes
+            restaurants = []
+            for restaurant in self._stream_restaurants(url, params, rate_limited=rate_limited):
+                if restaurant.slug not in seen_slugs:
+                    seen_slugs.add(restaurant.slug)
                     restaurants.append(restaurant)
-        
+        else:
+            data = self._make_request(url, params=params, rate_limited=rate_limited)
+
+            restaurants = []
+
+            # Parse the response structure - sections contain venue lists
+            sections = data.get("sections", [])
+            for section in sections:
+                # Skip sections that declare a non-venue template (banners,
+                # category carousels) - no point walking their items
+                template = section.get("template")
+                if template is not None and "venue" not in template:
+                    continue
+
+                items = section.get("items", [])
+                for item in items:
+                    venue = item.get("venue", {})
+                    if not venue:
+                        continue
+                    slug = venue.get("slug", "")
+                    if slug in seen_slugs:
+                        continue
+                    seen_slugs.add(slug)
+                    restaurants.append(self._parse_restaurant(venue))
+
+        now = time.monotonic()
+        for restaurant in restaurants:
+            self._slug_index[restaurant.slug] = (restaurant.is_online, now)
+
+        self._nearby_cache_put(cache_key, restaurants)
         return restaurants
+
+    async def aget_nearby_restaurants(self, lat: float, lon: float, radius: int = 2000,
+                                      rate_limited: bool = True) -> list[Restaurant]:
+        """
+        Async variant of get_nearby_restaurants
+
+        Runs the sync implementation on a worker thread; gather several of
+        these to fan grid-cell fetches out concurrently from async code
+        while sharing the session's keep-alive pool and caches.
+
+        Args:
+            lat: Latitude
+            lon: Longitude
+            radius: Search radius in meters (default: 2000)
+            rate_limited: Whether to apply the inter-request delay (default: True)
+
+        Returns:
+            List of Restaurant objects
+
+        Raises:
+            WoltAPIError: For API errors
+        """
+        return await asyncio.to_thread(
+            self.get_nearby_restaurants, lat, lon, radius, rate_limited=rate_limited
+        )
+
+    def _check_status(self, response) -> None:
+        """
+        Map error status codes to SDK exceptions
+
+        Args:
+            response: requests.Response to inspect
+
+        Raises:
+            WoltAPIError: For the known error status codes
+        """
+        if response.status_code == 404:
+            raise RestaurantNotFoundError("Restaurant not found (404)")
+        elif response.status_code == 429:
+            raise RateLimitError("Rate limit exceeded (429)")
+        elif response.status_code == 430:
+            raise APIUnavailableError("API unavailable - check headers or endpoint (430)")
+        elif response.status_code >= 500:
+            raise APIUnavailableError(f"Server error ({response.status_code})")
+
+        response.raise_for_status()
+
+    def _stream_restaurants(self, url: str, params: dict, rate_limited: bool = True,
+                            retry_on_rate_limit: bool = True):
+        """
+        Stream venue entries with ijson and yield parsed Restaurants
+
+        Only used when the optional ijson dependency is installed. Keeps the
+        same rate limiting, status handling and retry-once-on-429 behavior
+        as _make_request.
+
+        Args:
+            url: Full URL to request
+            params: Query parameters
+            rate_limited: Whether to apply the inter-request delay
+            retry_on_rate_limit: Whether to retry once on rate limit
+
+        Yields:
+            Restaurant objects, one per venue in the response
+
+        Raises:
+            WoltAPIError: For various API errors
+        """
+        if rate_limited:
+            self._rate_limit()
+
+        try:
+            with self.session.get(url, params=params, timeout=10, stream=True) as response:
+                try:
+                    self._check_status(response)
+                except RateLimitError:
+                    if not retry_on_rate_limit:
+                        raise
+                    response = None
+                if response is None:
+                    # Drain the bucket so concurrent callers pause too,
+                    # then wait longer and retry once
+                    self._penalize_rate_limit()
+                    time.sleep(5.0)
+                    yield from self._stream_restaurants(url, params, rate_limited=rate_limited,
+                                                        retry_on_rate_limit=False)
+                    return
+
+                # Let urllib3 transparently decompress before ijson sees it.
+                # Sections stream one at a time so the non-venue template
+                # filter matches the full-parse path - only single sections
+                # are held in memory, never the whole response tree
+                response.raw.decode_content = True
+                for section in ijson.items(response.raw, "sections.item"):
+                    # Skip sections that declare a non-venue template
+                    # (banners, category carousels) - no point walking
+                    # their items
+                    template = section.get("template")
+                    if template is not None and "venue" not in template:
+                        continue
+                    for item in section.get("items", []):
+                        venue = item.get("venue")
+                        if venue:
+                            yield self._parse_restaurant(venue)
+
+        except ijson.JSONError as e:
+            # Malformed or truncated bodies surface mid-iteration - map them
+            # onto the documented WoltAPIError like the full-parse path does
+            raise WoltAPIError(f"Invalid JSON response: {e}")
+        except requests.exceptions.RequestException as e:
+            raise WoltAPIError(f"Request failed: {e}")
+
+    def _nearby_cache_get(self, key: tuple) -> list[Restaurant] | None:
+        """Return a cached restaurant list if present and fresh, else None
+
+        Hits hand back a shallow copy - callers have always been free to
+        sort or mutate the returned list, and sharing the cached object
+        would let them corrupt the entry for every later hit.
+        """
+        with self._nearby_cache_lock:
+            entry = self._nearby_cache.get(key)
+            if entry is None:
+                return None
+            restaurants, stored_at = entry
+            if time.monotonic() - stored_at >= self.NEARBY_CACHE_TTL:
+                del self._nearby_cache[key]
+                return None
+            return list(restaurants)
+
+    def _nearby_cache_put(self, key: tuple, restaurants: list[Restaurant]) -> None:
+        """Store a restaurant list, evicting the oldest entry when full"""
+        with self._nearby_cache_lock:
+            if len(self._nearby_cache) >= self.NEARBY_CACHE_MAXSIZE:
+                oldest_key = min(self._nearby_cache, key=lambda k: self._nearby_cache[k][1])
+                del self._nearby_cache[oldest_key]
+            self._nearby_cache[key] = (restaurants, time.monotonic())
     
-    def find_restaurants(self, query: str, lat: float, lon: float) -> List[Restaurant]:
+    def find_restaurants(self, query: str, lat: float, lon: float) -> list[Restaurant]:
         """
         Search for restaurants by name/keyword
         
@@ -218,23 +741,11 @@ class WoltAPI:
         # by filtering nearby restaurants by name/keyword
         restaurants = self.get_nearby_restaurants(lat=lat, lon=lon, radius=5000)
         
-        # Filter restaurants by query
+        # Filter restaurants by query - each restaurant carries a cached
+        # lowercase name+cuisine haystack, so this is a single C-level
+        # substring check per restaurant with no repeated .lower() calls
         query_lower = query.lower()
-        matching_restaurants = []
-        
-        for restaurant in restaurants:
-            # Check if query matches name
-            if query_lower in restaurant.name.lower():
-                matching_restaurants.append(restaurant)
-                continue
-            
-            # Check if query matches any cuisine type
-            for cuisine in restaurant.cuisine_types:
-                if query_lower in cuisine.lower():
-                    matching_restaurants.append(restaurant)
-                    break
-        
-        return matching_restaurants
+        return [r for r in restaurants if query_lower in r.search_blob]
     
     def _parse_restaurant(self, venue_data: dict) -> Restaurant:
         """
@@ -246,6 +757,20 @@ class WoltAPI:
         Returns:
             Restaurant object
         """
+        # The 20 search circles overlap heavily (the Tel Aviv probes share
+        # most of their venues), so the same venue gets parsed repeatedly
+        # within one sweep - reuse the cached object unless its online
+        # status changed or the entry outlived the nearby-cache TTL (rating,
+        # delivery estimate and image drift too, just without a cheap field
+        # to diff against)
+        slug = venue_data.get("slug", "")
+        entry = self._parsed_cache.get(slug)
+        if entry is not None:
+            cached, built_at = entry
+            if (cached.is_online == venue_data.get("online", False)
+                    and time.monotonic() - built_at < self.NEARBY_CACHE_TTL):
+                return cached
+
         # Extract cuisine types from tags (tags are just strings)
         tags = venue_data.get("tags", [])
         cuisine_types = [tag for tag in tags if isinstance(tag, str)]
@@ -280,12 +805,18 @@ class WoltAPI:
         if rating_data and isinstance(rating_data, dict):
             rating = rating_data.get("score")
         
-        return Restaurant(
+        restaurant = Restaurant(
             name=venue_data.get("name", ""),
-            slug=venue_data.get("slug", ""),
+            slug=slug,
             is_online=venue_data.get("online", False),
             cuisine_types=cuisine_types,
             rating=rating,
             delivery_estimate=delivery_estimate,
             image_url=image_url
-        )
\ No newline at end of file
+        )
+
+        if len(self._parsed_cache) >= self.PARSED_CACHE_MAXSIZE:
+            self._parsed_cache.clear()
+        self._parsed_cache[slug] = (restaurant, time.monotonic())
+
+        return restaurant
\ No newline at end of file
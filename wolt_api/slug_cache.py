@@ -0,0 +1,119 @@
+"""
+Persistent slug -> search-location cache backed by SQLite
+"""
+import os
+import sqlite3
+import threading
+import time
+
+
+def default_cache_path() -> str:
+    """Return the default on-disk location for the slug cache"""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "wolt_api", "slug_locations.sqlite")
+
+
+class SlugLocationCache:
+    """
+    Cross-process cache of which search location a slug was discovered in
+
+    Fresh processes (cron runs, CLI invocations, CI) normally re-discover a
+    slug's location by sweeping all 20 Israeli search areas. Remembering the
+    winning (lat, lon, radius) on disk lets later runs go straight to the
+    right location with a single request.
+
+    All failures (unwritable cache dir, corrupt database, concurrent
+    access) degrade to cache misses - the cache must never take the
+    client down with it.
+    """
+
+    # Re-discover a slug's location daily in case the venue moves areas
+    TTL = 24 * 60 * 60
+
+    def __init__(self, path: str | None = None):
+        """
+        Open (or create) the cache database
+
+        Args:
+            path: Optional override for the database location
+        """
+        self.path = path or default_cache_path()
+        self._lock = threading.Lock()
+        self._conn = None
+
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS slug_locations ("
+                "slug TEXT PRIMARY KEY, "
+                "lat REAL, lon REAL, radius INTEGER, "
+                "updated_at REAL)"
+            )
+            self._conn.commit()
+        except (OSError, sqlite3.Error):
+            self._conn = None
+
+    def get(self, slug: str) -> tuple[float, float, int] | None:
+        """
+        Look up a slug's remembered search location
+
+        Args:
+            slug: Restaurant slug
+
+        Returns:
+            (lat, lon, radius) if present and fresh, else None
+        """
+        if self._conn is None:
+            return None
+
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT lat, lon, radius, updated_at FROM slug_locations WHERE slug = ?",
+                    (slug,),
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+
+        if row is None:
+            return None
+
+        lat, lon, radius, updated_at = row
+        if time.time() - updated_at >= self.TTL:
+            return None
+
+        return (lat, lon, radius)
+
+    def put(self, slug: str, lat: float, lon: float, radius: int) -> None:
+        """
+        Record (or refresh) the search location a slug was found in
+
+        Args:
+            slug: Restaurant slug
+            lat: Latitude of the search location
+            lon: Longitude of the search location
+            radius: Search radius in meters
+        """
+        if self._conn is None:
+            return
+
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO slug_locations (slug, lat, lon, radius, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (slug, lat, lon, radius, time.time()),
+                )
+                self._conn.commit()
+        except sqlite3.Error:
+            pass
+
+    def close(self) -> None:
+        """Close the underlying database connection"""
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except sqlite3.Error:
+                pass
+            self._conn = None